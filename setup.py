@@ -8,5 +8,6 @@ setup(
     author='Tushar Sharma',
     author_email='tusharmahalya.com',
     url='https://github.com/tushar-mahalya/MLOps_Utils',
-    install_requires=['mlflow'],
+    python_requires='>=3.8',
+    install_requires=['mlflow>=2.0', 'dvc[s3]>=3.0', 'GitPython>=3.1.41'],
 )
\ No newline at end of file